@@ -1,12 +1,206 @@
 import re
-import pandas as pd
 from PyPDF2 import PdfReader
 import os
 from pathlib import Path
 from datetime import datetime
 import unicodedata
 import json
-from dateutil import parser
+import argparse
+import textwrap
+import mmap
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+# pypdfium2 (PDFium) extrae texto mucho más rápido que PyPDF2; si no está
+# instalado se usa PyPDF2 como respaldo. Los dos motores no ordenan igual el
+# texto de las páginas a dos columnas, así que los resultados dependen de cuál
+# se use
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# orjson serializa JSON mucho más rápido que el módulo json estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patrones de expresiones regulares compilados una sola vez al importar el módulo
+# El propósito queda en el grupo 1. Solo se usa cuando str.lower cambia la
+# longitud del texto (ver extract_purpose)
+_PURPOSE_RE = re.compile(r'(?is)(por la cual.*?)ACUERDO')
+_MINISTRY_SPLIT_RE = re.compile(r"(Ministerio[^\n]+)")
+_ANCHOR_RE = re.compile(r'(DECRETO NÚMERO)|(RESOLUCIÓ?N NÚMERO)')
+_HYPHEN_NL_RE = re.compile(r'-\s*\n\s*')
+
+# Secuencias mal codificadas y su carácter correcto
+_MOJIBAKE_REPLACEMENTS = {
+    '√ö': 'ó',
+    '√≥': 'ó',
+    '√∫': 'ú',
+    '√≠': 'í',
+    '√°': 'á',
+    '√©': 'é',
+    '√±': 'ñ',
+    '√º': 'ü'
+}
+# Secuencias mal codificadas y texto no deseado al final, en una sola pasada.
+# Ninguna secuencia empieza como el texto final, así que el resultado es el
+# mismo que aplicarlas una tras otra
+_CLEANUP_RE = re.compile(
+    r'(?P<president>\s*El Presidente de la Rep.*$)|'
+    + '|'.join(map(re.escape, _MOJIBAKE_REPLACEMENTS))
+)
+
+# Patrones para identificar el inicio de diferentes tipos de documentos
+_NEXT_DOC_RE = re.compile('|'.join(f'({pattern})' for pattern in [
+    r'DECRETO\s+NÚMERO\s+\d+\s+DE\s+\d{4}',
+    r'RESOLUCIÓN\s+NÚMERO\s+\d+\s+DE\s+\d{4}',
+    r'RESOLUCIÓN\s+EJECUTIVA\s+NÚMERO\s+\d+\s+DE\s+\d{4}',
+    r'CIRCULAR\s+EXTERNA\s+CONJUNTA\s+NÚMERO\s+\d+\s+DE\s+\d{4}',
+    r'ACUERDO\s+NÚMERO\s+\d+\s+DE\s+\d{4}'
+]))
+_COMBINED_DOC_RE = re.compile('|'.join([
+    r'(DECRETO)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
+    r'(RESOLUCIÓN)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
+    r'(RESOLUCIÓN EJECUTIVA)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
+    r'(CIRCULAR EXTERNA CONJUNTA)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
+    r'(ACUERDO)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})'
+]), re.IGNORECASE)
+_DOC_TITLE_RE = re.compile(
+    r'(DECRETO|RESOLUCIÓN|RESOLUCIÓN EJECUTIVA|CIRCULAR EXTERNA CONJUNTA|ACUERDO)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
+    re.IGNORECASE
+)
+# Inicio y fin (heurístico) de la tabla de contenido
+# (los espacios entre letras no cruzan saltos de línea)
+_CONTENIDO_RE = re.compile(
+    r'C[^\S\n]*o[^\S\n]*n[^\S\n]*t[^\S\n]*e[^\S\n]*n[^\S\n]*i[^\S\n]*d[^\S\n]*o',
+    re.IGNORECASE
+)
+_TOC_END_RE = re.compile(r'P[áa]gina|^\d+$', re.IGNORECASE | re.MULTILINE)
+
+# Línea no vacía de la tabla de contenido (sin espacios en los extremos):
+# encabezado de entidad o línea de decreto/resolución
+_TOC_LINE_RE = re.compile(
+    r'^\s*(?:(?P<entity>(?:MINISTERIO|DEPARTAMENTO|ENTIDAD|ORGANISMO)[^\n]*?)'
+    r'|(?P<linea>[^\n]*?\S))\s*$',
+    re.MULTILINE | re.IGNORECASE
+)
+
+# Nombre de entidad al inicio de una línea de la tabla de contenido
+_ENTITY_NAME_RE = re.compile(
+    r'((MINISTERIO|DEPARTAMENTO|ORGANISMO|ENTIDAD)[A-ZÁÉÍÓÚÑ\s]+)', re.IGNORECASE
+)
+# Institución al inicio de una línea del documento
+_INSTITUTION_RE = re.compile(
+    r'^(Ministerio|Departamento|Entidad|Organismo)[^\n]+', re.MULTILINE
+)
+# Fecha de publicación en el encabezado del Diario Oficial
+_PUB_DATE_RE = re.compile(
+    r'Bogotá, D\. C\., [^,]+,\s+(\d{1,2})\s+de\s+([a-zA-Z]+)\s+de\s+(\d{4})'
+)
+# Meses en español y su número
+_MONTH_MAP = {
+    'enero': '01', 'febrero': '02', 'marzo': '03', 'abril': '04',
+    'mayo': '05', 'junio': '06', 'julio': '07', 'agosto': '08',
+    'septiembre': '09', 'octubre': '10', 'noviembre': '11', 'diciembre': '12'
+}
+
+# Tipos de documento en una sola alternativa con grupos con nombre; se
+# clasifica según el encabezado que aparece primero en el título
+_DOC_TYPE_RE = re.compile(
+    r'(?P<DECRETO>DECRETO\s+NÚMERO\s+\d+\s+DE\s+\d{4})'
+    r'|(?P<RESOLUCION_EJECUTIVA>RESOLUCIÓN\s+EJECUTIVA\s+NÚMERO\s+\d+\s+DE\s+\d{4})'
+    r'|(?P<RESOLUCION>RESOLUCIÓN\s+NÚMERO\s+\d+\s+DE\s+\d{4})'
+    r'|(?P<CIRCULAR>CIRCULAR\s+EXTERNA\s+CONJUNTA\s+NÚMERO\s+\d+\s+DE\s+\d{4})'
+    r'|(?P<ACUERDO>ACUERDO\s+NÚMERO\s+\d+\s+DE\s+\d{4})'
+)
+_DOC_TYPE_LABELS = {
+    'DECRETO': 'DECRETO',
+    'RESOLUCION_EJECUTIVA': 'RESOLUCIÓN EJECUTIVA',
+    'RESOLUCION': 'RESOLUCIÓN',
+    'CIRCULAR': 'CIRCULAR EXTERNA CONJUNTA',
+    'ACUERDO': 'ACUERDO',
+}
+
+def _extract_page_texts(pdf_path):
+    """
+    Extrae el texto de cada página del PDF, omitiendo las páginas vacías. Se
+    guarda en caché solo el último archivo leído, por ruta y fecha de
+    modificación, así que varios análisis seguidos del mismo archivo lo leen
+    una sola vez sin retener en memoria el texto de los anteriores.
+    
+    Args:
+        pdf_path (str): Ruta al archivo PDF
+        
+    Returns:
+        tuple: Texto de cada página
+    """
+    pdf_path = str(pdf_path)
+    return _load_page_texts(pdf_path, os.stat(pdf_path).st_mtime_ns)
+
+@lru_cache(maxsize=1)
+def _load_page_texts(pdf_path, mtime_ns):
+    # mtime_ns solo forma parte de la clave de la caché: si el archivo cambia,
+    # se vuelve a leer
+    return tuple(_read_page_texts(pdf_path))
+
+def _read_page_texts(pdf_path):
+    """
+    Lee el texto de cada página del PDF con pypdfium2 o, si no está
+    disponible, con PyPDF2.
+    
+    Args:
+        pdf_path (str): Ruta al archivo PDF
+        
+    Returns:
+        list: Lista con el texto de cada página no vacía
+    """
+    # Las páginas se extraen en secuencia: PDFium no admite acceso concurrente
+    # a un mismo documento y PyPDF2 comparte el flujo del archivo entre
+    # páginas y retiene el GIL. El paralelismo se aplica por archivo en main()
+    pages = []
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                # PDFium separa las líneas con '\r\n' y marca con U+FFFE la
+                # palabra dividida con guion al final de una línea, sin salto;
+                # se deja como '-\n', igual que en el texto de PyPDF2
+                page_text = (textpage.get_text_range()
+                             .replace('\r\n', '\n')
+                             .replace('\ufffe', '-\n'))
+                textpage.close()
+                page.close()
+                if page_text:
+                    pages.append(page_text)
+        finally:
+            pdf.close()
+        return pages
+
+    # PyPDF2 lee sobre un mapa en memoria del archivo, que se cierra al
+    # terminar la extracción
+    with open(pdf_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for page in PdfReader(mm).pages:
+            page_text = page.extract_text()
+            if page_text:
+                pages.append(page_text)
+    return pages
+
+def _extract_full_text(pdf_path):
+    """
+    Extrae el texto completo del PDF uniendo el texto de todas sus páginas.
+    
+    Args:
+        pdf_path (str): Ruta al archivo PDF
+        
+    Returns:
+        str: Texto completo del PDF
+    """
+    return '\n'.join(_extract_page_texts(pdf_path))
 
 def extract_purpose(text):
     """
@@ -18,11 +212,21 @@ def extract_purpose(text):
     Returns:
         str: Propósito extraído o cadena vacía si no se encuentra
     """
-    # Buscar el propósito que comienza con "por la cual" y termina con "ACUERDO"
-    match = re.search(r'por la cual.*?(?=ACUERDO)', text, re.DOTALL | re.IGNORECASE)
-    if match:
-        return match.group(0).strip()
-    return ""
+    # Buscar el propósito que comienza con "por la cual" y termina con "ACUERDO",
+    # sin distinguir mayúsculas y minúsculas, con búsquedas literales
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Algunos caracteres (como 'İ') cambian de longitud al pasar a
+        # minúsculas y los índices ya no corresponden al texto original
+        match = _PURPOSE_RE.search(text)
+        return match.group(1).strip() if match else ""
+    start = lowered.find('por la cual')
+    if start == -1:
+        return ""
+    end = lowered.find('acuerdo', start + len('por la cual'))
+    if end == -1:
+        return ""
+    return text[start:end].strip()
 
 def analyze_pdf(pdf_path):
     """
@@ -32,67 +236,52 @@ def analyze_pdf(pdf_path):
         pdf_path (str): Ruta al archivo PDF
         
     Returns:
-        pd.DataFrame: DataFrame con la información extraída
+        list: Lista de diccionarios con la información extraída
     """
     # Leer el PDF
-    reader = PdfReader(pdf_path)
-    full_text = '\n'.join(page.extract_text() for page in reader.pages if page.extract_text())
+    full_text = _extract_full_text(pdf_path)
 
     # Dividir por ministerio
-    sections = re.split(r"(Ministerio[^\n]+)", full_text)
+    sections = _MINISTRY_SPLIT_RE.split(full_text)
     data = []
 
     for i in range(1, len(sections), 2):
         ministry = sections[i].strip()
         content = sections[i+1]
         
-        # Extraer decretos
-        decrees = re.findall(
-            r"(DECRETO NÚMERO.*?)(?=(?:DECRETO NÚMERO|RESOLUCIÓ?N NÚMERO|$))",
-            content, flags=re.S
-        )
-        for dec in decrees:
-            dec = dec.strip()
-            # Extraer el título (primera línea)
-            title = dec.split('\n')[0].strip()
-            # Extraer el propósito
-            purpose = extract_purpose(dec)
-            # El resto del contenido
-            remaining_text = dec[len(title):].strip()
-            
-            data.append({
-                'ministerio': ministry,
-                'tipo_documento': 'DECRETO',
-                'titulo': title,
-                'proposito': purpose,
-                'contenido': remaining_text
-            })
-            
-        # Extraer resoluciones
-        resolutions = re.findall(
-            r"(RESOLUCIÓ?N NÚMERO.*?)(?=(?:DECRETO NÚMERO|RESOLUCIÓ?N NÚMERO|$))",
-            content, flags=re.S
-        )
-        for res in resolutions:
-            res = res.strip()
-            # Extraer el título (primera línea)
-            title = res.split('\n')[0].strip()
+        # Omitir rápidamente las secciones sin decretos ni resoluciones
+        if 'DECRETO NÚMERO' not in content and 'RESOLUCI' not in content:
+            continue
+        
+        # Extraer decretos y resoluciones en una sola pasada, cortando cada
+        # bloque desde su encabezado hasta el encabezado siguiente
+        anchors = list(_ANCHOR_RE.finditer(content))
+        for j, match in enumerate(anchors):
+            end = anchors[j+1].start() if j + 1 < len(anchors) else len(content)
+            block = content[match.start():end].strip()
+            doc_type = 'DECRETO' if match.group(1) else 'RESOLUCIÓN'
+            # Extraer el título (primera línea) y el resto del contenido
+            title, _, remaining_text = block.partition('\n')
+            title = title.strip()
+            remaining_text = remaining_text.strip()
             # Extraer el propósito
-            purpose = extract_purpose(res)
-            # El resto del contenido
-            remaining_text = res[len(title):].strip()
+            purpose = extract_purpose(block)
             
             data.append({
                 'ministerio': ministry,
-                'tipo_documento': 'RESOLUCIÓN',
+                'tipo_documento': doc_type,
                 'titulo': title,
                 'proposito': purpose,
                 'contenido': remaining_text
             })
 
-    # Crear DataFrame
-    df = pd.DataFrame(data)
-    return df
+    return data
+
+def _cleanup_replacement(match):
+    # El texto final se elimina; las secuencias mal codificadas se corrigen
+    if match.group('president') is not None:
+        return ''
+    return _MOJIBAKE_REPLACEMENTS[match.group(0)]
 
 def clean_text(text):
     """
@@ -107,82 +296,66 @@ def clean_text(text):
     # Normalizar caracteres especiales
     text = unicodedata.normalize('NFKD', text)
     
-    # Reemplazar caracteres específicos
-    replacements = {
-        '√ö': 'ó',
-        '√≥': 'ó',
-        '√∫': 'ú',
-        '√≠': 'í',
-        '√°': 'á',
-        '√©': 'é',
-        '√±': 'ñ',
-        '√º': 'ü'
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    
-    # Eliminar texto no deseado al final
-    text = re.sub(r'\s*El Presidente de la Rep.*$', '', text)
+    # Reemplazar caracteres específicos y eliminar texto no deseado al final
+    text = _CLEANUP_RE.sub(_cleanup_replacement, text)
     
     # Eliminar guiones al final de línea
-    text = re.sub(r'-\s*\n\s*', '', text)
+    text = _HYPHEN_NL_RE.sub('', text)
     
-    # Eliminar espacios múltiples
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    # Eliminar espacios múltiples (y los de los extremos)
+    return ' '.join(text.split())
 
-def extract_table_of_contents(pdf_path):
+def extract_table_of_contents(pdf_path=None, full_text=None):
     """
     Extrae la tabla de contenido de un PDF con formato de dos columnas.
     
     Args:
         pdf_path (str): Ruta al archivo PDF
+        full_text (str): Texto completo ya extraído del PDF (sin procesar);
+            si se indica, no se vuelve a leer el archivo
         
     Returns:
         list: Lista de diccionarios con entidad y línea completa de cada decreto/resolución
     """
-    reader = PdfReader(pdf_path)
-    full_text = '\n'.join(page.extract_text() for page in reader.pages if page.extract_text())
-    lines = full_text.split('\n')
+    if full_text is None:
+        full_text = _extract_full_text(pdf_path)
 
-    # Buscar el inicio de la tabla de contenido
-    toc_start = -1
-    for i, line in enumerate(lines):
-        if re.search(r'C\s*o\s*n\s*t\s*e\s*n\s*i\s*d\s*o', line, re.IGNORECASE):
-            toc_start = i
-            break
-    if toc_start == -1:
+    # Buscar el inicio de la tabla de contenido directamente en el texto, sin
+    # dividirlo en líneas si no la hay
+    toc_match = _CONTENIDO_RE.search(full_text)
+    if not toc_match:
         return []
 
-    # Buscar el final de la tabla de contenido (puede ser heurístico)
-    toc_end = len(lines)
-    for i in range(toc_start+1, len(lines)):
-        if re.search(r'P[áa]gina|^\d+$', lines[i], re.IGNORECASE):
-            toc_end = i
-            break
-    toc_lines = lines[toc_start:toc_end]
+    # La tabla empieza en la línea del marcador
+    toc_start = full_text.rfind('\n', 0, toc_match.start()) + 1
+
+    # Buscar el final de la tabla de contenido (puede ser heurístico) desde
+    # la línea siguiente; la tabla termina justo antes de la línea encontrada
+    toc_end = len(full_text)
+    first_line_end = full_text.find('\n', toc_start)
+    if first_line_end != -1:
+        end_match = _TOC_END_RE.search(full_text, first_line_end + 1)
+        if end_match:
+            toc_end = full_text.rfind('\n', 0, end_match.start())
+    toc_text = full_text[toc_start:toc_end]
 
+    # Recorrer las líneas no vacías de la tabla en una sola pasada del motor
+    # de expresiones regulares, distinguiendo encabezados de entidad
     data = []
     current_entity = None
-    entity_pattern = re.compile(r'^(MINISTERIO|DEPARTAMENTO|ENTIDAD|ORGANISMO)[^\n]*', re.IGNORECASE)
-    for line in toc_lines:
-        line = line.strip()
-        if not line:
-            continue
-        entity_match = entity_pattern.match(line)
-        if entity_match:
-            current_entity = line.strip()
+    for match in _TOC_LINE_RE.finditer(toc_text):
+        if match.group('entity'):
+            current_entity = match.group('entity')
             continue
         # Guardar cada línea de decreto/resolución junto con la entidad actual
         if current_entity:
             data.append({
                 'entidad': current_entity,
-                'linea': line
+                'linea': match.group('linea')
             })
     return data
 
+@lru_cache(maxsize=512)
 def clean_entity_name(entity):
     """
     Extrae solo el nombre puro de la entidad colombiana.
@@ -196,7 +369,7 @@ def clean_entity_name(entity):
         'COMUNICAR', 'POR', 'DECRETO', 'RESOLUCIÓN', 'RESOLUCION', 'ACUERDO', 'CIRCULAR', 'CONTENIDO', 'PRESENTE', 'DOCTORES'
     ]
     # Buscar el patrón de entidad al inicio
-    match = re.match(r'((MINISTERIO|DEPARTAMENTO|ORGANISMO|ENTIDAD)[A-ZÁÉÍÓÚÑ\s]+)', entity.strip(), re.IGNORECASE)
+    match = _ENTITY_NAME_RE.match(entity.strip())
     if match:
         nombre = match.group(1).strip()
         # Cortar en la primera stopword encontrada
@@ -212,35 +385,68 @@ def clean_entity_name(entity):
     # Si no encuentra patrón, devuelve solo las primeras 8 palabras (por seguridad)
     return ' '.join(entity.strip().split()[:8]).title()
 
+class _AsciiFoldTable(dict):
+    """
+    Tabla para str.translate que asigna a cada carácter su equivalente ASCII
+    (descomposición NFKD sin los caracteres no ASCII). Cada carácter se
+    calcula la primera vez que aparece y queda guardado en la tabla.
+    """
+    def __missing__(self, codepoint):
+        folded = unicodedata.normalize('NFKD', chr(codepoint)).encode('ASCII', 'ignore').decode('ASCII')
+        self[codepoint] = folded
+        return folded
+
+_ACCENT_TABLE = _AsciiFoldTable()
+
 def normalize_text(text):
     # Quita tildes y pasa a mayúsculas
-    return unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII').upper() if text else ''
+    if not text:
+        return ''
+    if text.isascii():
+        return text.upper()
+    return text.translate(_ACCENT_TABLE).upper()
+
+def normalize_toc(toc_data):
+    """
+    Normaliza una sola vez las líneas de la tabla de contenido para las
+    búsquedas de find_entity_fuzzy.
+    
+    Args:
+        toc_data (list): Resultado de extract_table_of_contents
+        
+    Returns:
+        list: Lista de tuplas (línea normalizada, entidad)
+    """
+    return [(normalize_text(entry['linea']), entry['entidad']) for entry in toc_data]
 
-def find_entity_fuzzy(toc_data, tipo, numero, anio):
+def find_entity_fuzzy(toc_norm, tipo, numero, anio):
     tipo = normalize_text(tipo)
     numero = normalize_text(numero)
     anio = normalize_text(anio)
     last_entity = None
+    # Mejor coincidencia parcial: 2 = número y año, 1 = solo año
+    best_priority = 0
+    best_entity = None
 
-    # 1. Coincidencia completa
-    for entry in toc_data:
-        linea = normalize_text(entry['linea'])
-        if tipo in linea and numero in linea and anio in linea:
-            return clean_entity_name(entry['entidad'])
-        if entry['entidad']:
-            last_entity = entry['entidad']
-
-    # 2. Coincidencia por número y año
-    for entry in toc_data:
-        linea = normalize_text(entry['linea'])
-        if numero in linea and anio in linea:
-            return clean_entity_name(entry['entidad'])
-
-    # 3. Coincidencia solo por año
-    for entry in toc_data:
-        linea = normalize_text(entry['linea'])
+    for linea, entidad in toc_norm:
         if anio in linea:
-            return clean_entity_name(entry['entidad'])
+            # 1. Coincidencia completa
+            if numero in linea:
+                if tipo in linea:
+                    return clean_entity_name(entidad)
+                priority = 2
+            else:
+                priority = 1
+            # Conservar la primera coincidencia de cada prioridad
+            if priority > best_priority:
+                best_priority = priority
+                best_entity = entidad
+        if entidad:
+            last_entity = entidad
+
+    # 2. Coincidencia por número y año, 3. Coincidencia solo por año
+    if best_priority:
+        return clean_entity_name(best_entity)
 
     # 4. Si no hay coincidencia, devolver la última entidad conocida
     if last_entity:
@@ -259,62 +465,18 @@ def process_two_column_text(text):
     Returns:
         str: Texto procesado y ordenado
     """
-    # Dividir el texto en líneas
-    lines = text.split('\n')
-    processed_lines = []
-    current_line = []
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Si la línea termina con guión, es parte de una palabra dividida
-        if line.endswith('-'):
-            current_line.append(line[:-1])
-        else:
-            current_line.append(line)
-            # Unir la línea y agregarla a las líneas procesadas
-            processed_lines.append(' '.join(current_line))
-            current_line = []
-    
-    # Agregar la última línea si existe
-    if current_line:
-        processed_lines.append(' '.join(current_line))
-    
-    return '\n'.join(processed_lines)
-
-def extract_document_content(text, start_index):
-    """
-    Extrae el contenido de un documento desde un índice inicial hasta el siguiente documento.
-    
-    Args:
-        text (str): Texto completo del documento
-        start_index (int): Índice donde comienza el documento
-        
-    Returns:
-        tuple: (contenido, siguiente_índice)
-    """
-    # Patrones para identificar el inicio de diferentes tipos de documentos
-    document_patterns = [
-        r'DECRETO\s+NÚMERO\s+\d+\s+DE\s+\d{4}',
-        r'RESOLUCIÓN\s+NÚMERO\s+\d+\s+DE\s+\d{4}',
-        r'RESOLUCIÓN\s+EJECUTIVA\s+NÚMERO\s+\d+\s+DE\s+\d{4}',
-        r'CIRCULAR\s+EXTERNA\s+CONJUNTA\s+NÚMERO\s+\d+\s+DE\s+\d{4}',
-        r'ACUERDO\s+NÚMERO\s+\d+\s+DE\s+\d{4}'
-    ]
+    # Recortar las líneas y descartar las vacías
+    lines = [line.strip() for line in text.split('\n')]
+    text = '\n'.join(filter(None, lines))
     
-    # Combinar todos los patrones
-    combined_pattern = '|'.join(f'({pattern})' for pattern in document_patterns)
+    # Si la línea termina con guión, es parte de una palabra dividida y se
+    # une a la siguiente con un espacio
+    text = text.replace('-\n', ' ')
     
-    # Buscar el siguiente documento
-    next_doc = re.search(combined_pattern, text[start_index + 1:])
-    
-    if next_doc:
-        end_index = start_index + 1 + next_doc.start()
-        return text[start_index:end_index].strip(), end_index
-    else:
-        return text[start_index:].strip(), len(text)
+    # La última línea también pierde su guión final
+    if text.endswith('-'):
+        text = text[:-1]
+    return text
 
 def identify_document_type(title):
     """
@@ -326,18 +488,10 @@ def identify_document_type(title):
     Returns:
         str: Tipo de documento
     """
-    title = title.upper()
-    if re.search(r'DECRETO\s+NÚMERO\s+\d+\s+DE\s+\d{4}', title):
-        return 'DECRETO'
-    elif re.search(r'RESOLUCIÓN\s+EJECUTIVA\s+NÚMERO\s+\d+\s+DE\s+\d{4}', title):
-        return 'RESOLUCIÓN EJECUTIVA'
-    elif re.search(r'RESOLUCIÓN\s+NÚMERO\s+\d+\s+DE\s+\d{4}', title):
-        return 'RESOLUCIÓN'
-    elif re.search(r'CIRCULAR\s+EXTERNA\s+CONJUNTA\s+NÚMERO\s+\d+\s+DE\s+\d{4}', title):
-        return 'CIRCULAR EXTERNA CONJUNTA'
-    elif re.search(r'ACUERDO\s+NÚMERO\s+\d+\s+DE\s+\d{4}', title):
-        return 'ACUERDO'
-    return 'OTRO'
+    # En el caso común el título empieza con el encabezado y la búsqueda
+    # termina en la primera posición
+    match = _DOC_TYPE_RE.search(title.upper())
+    return _DOC_TYPE_LABELS[match.lastgroup] if match else 'OTRO'
 
 def extract_publication_date(text):
     """
@@ -350,8 +504,7 @@ def extract_publication_date(text):
         str: Fecha de publicación en formato YYYY-MM-DD o cadena vacía si no se encuentra
     """
     # Buscar el patrón de fecha en el encabezado
-    date_pattern = r'Bogotá, D\. C\., [^,]+,\s+(\d{1,2})\s+de\s+([a-zA-Z]+)\s+de\s+(\d{4})'
-    match = re.search(date_pattern, text)
+    match = _PUB_DATE_RE.search(text)
     
     if match:
         try:
@@ -359,15 +512,10 @@ def extract_publication_date(text):
             month = match.group(2)
             year = match.group(3)
             # Convertir el mes de texto a número
-            month_map = {
-                'enero': '01', 'febrero': '02', 'marzo': '03', 'abril': '04',
-                'mayo': '05', 'junio': '06', 'julio': '07', 'agosto': '08',
-                'septiembre': '09', 'octubre': '10', 'noviembre': '11', 'diciembre': '12'
-            }
-            month_num = month_map.get(month.lower(), '01')
+            month_num = _MONTH_MAP.get(month.lower(), '01')
             # Formatear la fecha como YYYY-MM-DD
-            return f"{year}-{month_num}-{day.zfill(2)}"
-        except:
+            return f"{year}-{month_num}-{int(day):02d}"
+        except (KeyError, ValueError):
             return ""
     return ""
 
@@ -382,8 +530,7 @@ def extract_institution(text):
         str: Nombre de la institución o cadena vacía si no se encuentra
     """
     # Buscar el patrón de institución al inicio del documento
-    institution_pattern = r'^(Ministerio|Departamento|Entidad|Organismo)[^\n]+'
-    match = re.search(institution_pattern, text, re.MULTILINE)
+    match = _INSTITUTION_RE.search(text)
     
     if match:
         return match.group(0).strip()
@@ -391,53 +538,48 @@ def extract_institution(text):
 
 def extract_documents(pdf_path):
     """
-    Extrae todos los documentos del PDF y los estructura en un DataFrame.
+    Extrae todos los documentos del PDF y los estructura en una lista de diccionarios.
     
     Args:
         pdf_path (str): Ruta al archivo PDF
         
     Returns:
-        pd.DataFrame: DataFrame con la información extraída
-    """
-    reader = PdfReader(pdf_path)
-    processed_pages = []
-    for page in reader.pages:
-        if page.extract_text():
-            page_text = process_two_column_text(page.extract_text())
-            processed_pages.append(page_text)
+        list: Lista de diccionarios con la información extraída
+    """
+    # Leer el PDF una sola vez: el texto original sirve para la tabla de
+    # contenido y el procesado para los documentos
+    page_texts = _extract_page_texts(pdf_path)
+    processed_pages = [process_two_column_text(page_text) for page_text in page_texts]
     full_text = '\n'.join(processed_pages)
     publication_date = extract_publication_date(full_text)
 
-    # Extraer la tabla de contenido como lista de dicts
-    toc_data = extract_table_of_contents(pdf_path)
-
-    document_patterns = [
-        r'(DECRETO)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
-        r'(RESOLUCIÓN)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
-        r'(RESOLUCIÓN EJECUTIVA)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
-        r'(CIRCULAR EXTERNA CONJUNTA)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})',
-        r'(ACUERDO)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})'
-    ]
-    combined_pattern = '|'.join(document_patterns)
+    # Extraer la tabla de contenido y normalizar sus líneas una sola vez
+    toc_norm = normalize_toc(extract_table_of_contents(full_text='\n'.join(page_texts)))
+    # Entidades ya buscadas en este PDF por (tipo, número, año)
+    entity_cache = {}
 
+    # Recorrer el texto sin copiarlo: cada documento empieza donde coincide el
+    # patrón flexible y termina en el siguiente encabezado de documento
     documents = []
     current_index = 0
     while True:
-        match = re.search(combined_pattern, full_text[current_index:], re.IGNORECASE)
+        match = _COMBINED_DOC_RE.search(full_text, current_index)
         if not match:
             break
-        start_index = current_index + match.start()
-        content, next_index = extract_document_content(full_text, start_index)
-        lines = content.split('\n')
-        title = lines[0].strip()
+        start_index = match.start()
+        next_doc = _NEXT_DOC_RE.search(full_text, start_index + 1)
+        next_index = next_doc.start() if next_doc else len(full_text)
+        content = full_text[start_index:next_index].strip()
+        title, _, body = content.partition('\n')
+        title = title.strip()
         # Buscar tipo, número y año en el título
-        doc_match = re.match(r'(DECRETO|RESOLUCIÓN|RESOLUCIÓN EJECUTIVA|CIRCULAR EXTERNA CONJUNTA|ACUERDO)\s+N[ÚU]MERO\s+(\d+)\s+DE\s+(\d{4})', title, re.IGNORECASE)
+        doc_match = _DOC_TITLE_RE.match(title)
         tipo = doc_match.group(1).upper() if doc_match else ''
         numero = doc_match.group(2) if doc_match else ''
         anio = doc_match.group(3) if doc_match else ''
         date = ""
         description_lines = []
-        for line in lines[1:]:
+        for line in body.split('\n') if body else ():
             line = line.strip()
             if line.startswith('(') and line.endswith(')'):
                 date = line
@@ -448,7 +590,10 @@ def extract_documents(pdf_path):
             title = f"{title}\n{date}"
         doc_type = identify_document_type(title)
         # Buscar la entidad usando fuzzy
-        institution = find_entity_fuzzy(toc_data, tipo, numero, anio)
+        entity_key = (tipo, numero, anio)
+        if entity_key not in entity_cache:
+            entity_cache[entity_key] = find_entity_fuzzy(toc_norm, tipo, numero, anio)
+        institution = entity_cache[entity_key]
         documents.append({
             'tipo_documento': doc_type,
             'titulo': title,
@@ -459,7 +604,50 @@ def extract_documents(pdf_path):
         current_index = next_index
     return documents
 
+def _dump_json(doc, pretty=False):
+    """
+    Serializa un documento a JSON, con orjson si está disponible.
+    
+    Args:
+        doc (dict): Documento a serializar
+        pretty (bool): Si es True, indenta con dos espacios; si no, usa el
+            formato compacto
+        
+    Returns:
+        str: Documento en formato JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(doc, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    if pretty:
+        return json.dumps(doc, ensure_ascii=False, indent=2)
+    return json.dumps(doc, ensure_ascii=False, separators=(',', ':'))
+
+# Modos de análisis disponibles en la línea de comandos:
+# modo -> (función de extracción, prefijo del archivo de salida,
+#          campo del resumen, descripción del resumen)
+_MODES = {
+    'documents': (extract_documents, 'documentos', 'tipo_documento', 'tipo de documento'),
+    'decree': (analyze_pdf, 'decretos', 'tipo_documento', 'tipo de documento'),
+    'toc': (extract_table_of_contents, 'contenido', 'entidad', 'entidad'),
+}
+
 def main():
+    arg_parser = argparse.ArgumentParser(
+        description='Analiza los PDFs del Diario Oficial del directorio data/'
+    )
+    arg_parser.add_argument(
+        '--mode', choices=list(_MODES), default='documents',
+        help='documents: todos los documentos (por defecto); '
+             'decree: decretos y resoluciones por ministerio; '
+             'toc: tabla de contenido'
+    )
+    arg_parser.add_argument(
+        '--pretty', action='store_true',
+        help='guardar un arreglo JSON indentado en lugar de JSON Lines compacto'
+    )
+    args = arg_parser.parse_args()
+    extract, output_prefix, summary_field, summary_label = _MODES[args.mode]
+
     # Obtener la ruta del directorio actual
     current_dir = Path(__file__).parent.parent
     data_dir = current_dir / 'data'
@@ -470,38 +658,61 @@ def main():
     resultados_dir.mkdir(exist_ok=True)
     
     # Procesar todos los PDFs en el directorio data
-    all_data = []
-    for pdf_file in data_dir.glob('*.pdf'):
-        print(f"Procesando {pdf_file.name}...")
-        documents = extract_documents(str(pdf_file))
-        # Agregar el nombre del archivo a cada documento
-        for doc in documents:
-            doc['archivo'] = pdf_file.name
-        all_data.extend(documents)
-    
-    if all_data:
-        # Generar nombre de archivo con timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = resultados_dir / f'documentos_{timestamp}.json'
-        
-        # Guardar resultados en formato JSON
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"\nResultados guardados en: {output_file}")
-        print(f"Total de documentos procesados: {len(all_data)}")
-        
-        # Mostrar resumen por tipo de documento
-        print("\nResumen por tipo de documento:")
-        doc_types = {}
-        for doc in all_data:
-            doc_type = doc['tipo_documento']
-            doc_types[doc_type] = doc_types.get(doc_type, 0) + 1
-        
-        for doc_type, count in doc_types.items():
-            print(f"{doc_type}: {count}")
-    else:
+    pdf_files = list(data_dir.glob('*.pdf'))
+    if not pdf_files:
         print("No se encontraron archivos PDF en el directorio 'data'")
+        return
+    # Los resultados dependen del motor de extracción de texto (ver README)
+    print(f"Motor de extracción de texto: {'pypdfium2' if pdfium is not None else 'PyPDF2'}")
+
+    # Generar nombre de archivo con timestamp
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    extension = 'json' if args.pretty else 'jsonl'
+    output_file = resultados_dir / f'{output_prefix}_{timestamp}.{extension}'
+
+    # Cada PDF es independiente, así que se reparten entre procesos. Los
+    # documentos se escriben a medida que termina cada PDF, sin acumularlos
+    # en memoria: en JSON Lines compacto (un documento por línea) o, con
+    # --pretty, como elementos de un arreglo JSON indentado. Se escribe en un
+    # archivo temporal que solo se renombra si todos los PDFs se procesaron,
+    # para no dejar resultados parciales si alguno falla
+    total_docs = 0
+    summary = {}
+    temp_file = output_file.with_name(output_file.name + '.tmp')
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f, \
+                ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            if args.pretty:
+                f.write('[')
+            results = executor.map(extract, [str(p) for p in pdf_files])
+            for pdf_file, documents in zip(pdf_files, results):
+                print(f"Procesando {pdf_file.name}...")
+                for doc in documents:
+                    # Agregar el nombre del archivo a cada documento
+                    doc['archivo'] = pdf_file.name
+                    if args.pretty:
+                        f.write(',\n' if total_docs else '\n')
+                        f.write(textwrap.indent(_dump_json(doc, pretty=True), '  '))
+                    else:
+                        f.write(_dump_json(doc))
+                        f.write('\n')
+                    total_docs += 1
+                    key = doc[summary_field]
+                    summary[key] = summary.get(key, 0) + 1
+            if args.pretty:
+                f.write('\n]' if total_docs else ']')
+        os.replace(temp_file, output_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    print(f"\nResultados guardados en: {output_file}")
+    print(f"Total de documentos procesados: {total_docs}")
+
+    # Mostrar resumen
+    print(f"\nResumen por {summary_label}:")
+    for key, count in summary.items():
+        print(f"{key}: {count}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 